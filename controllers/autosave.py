@@ -0,0 +1,159 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+
+from models.game_state import GameState
+
+
+@dataclass
+class AutosaveStats:
+    saved: int = 0
+    dropped: int = 0        # stale snapshots replaced before the writer got to them
+    failed: int = 0
+    snapshot_ms: float = 0.0  # last snapshot cost on the game thread
+    last_ms: float = 0.0      # last snapshot -> on-disk latency
+    max_ms: float = 0.0
+    total_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.saved if self.saved else 0.0
+
+    def summary(self) -> str:
+        return (f"Autosave: {self.saved} saved, {self.dropped} dropped, {self.failed} failed | "
+                f"latency avg {self.avg_ms:.1f} ms, max {self.max_ms:.1f} ms | "
+                f"snapshot {self.snapshot_ms:.2f} ms")
+
+
+class Autosaver:
+    """
+    Periodic autosave. The game thread only takes a snapshot (GameState.snapshot);
+    a background thread serializes it and writes it atomically (temp file + rename).
+    The queue is bounded: when the writer falls behind, the oldest pending
+    snapshot is dropped in favour of the newest.
+    """
+
+    def __init__(self, path: str, interval: float = 5.0, max_pending: int = 1) -> None:
+        self.path = os.path.abspath(path)
+        self.interval = interval
+        self.stats = AutosaveStats()
+        self._queue: "queue.Queue[Optional[tuple[float, dict]]]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()  # guards stats shared with the writer
+        self._thread: Optional[threading.Thread] = None
+        self._last_save = float("-inf")
+
+    # -------- game thread --------
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+
+    def maybe_save(self, state: GameState) -> None:
+        """Save if `interval` seconds have passed since the last one. Never blocks."""
+        if time.monotonic() - self._last_save >= self.interval:
+            self.save_now(state)
+
+    def save_now(self, state: GameState) -> None:
+        t0 = time.perf_counter()
+        snap = state.snapshot()
+        with self._lock:
+            self.stats.snapshot_ms = (time.perf_counter() - t0) * 1000
+        self._last_save = time.monotonic()
+        self._offer((t0, snap))
+
+    def stop(self, flush: bool = True, timeout: float = 5.0) -> None:
+        """
+        Stop the writer; with `flush`, wait (up to `timeout` seconds) for the
+        pending snapshot to land first. Never hangs on a dead or stuck writer.
+        """
+        thread, self._thread = self._thread, None
+        if thread is None or not thread.is_alive():
+            return
+        if not flush:
+            self._drain()
+        try:
+            self._queue.put((0.0, None), timeout=timeout)  # sentinel
+        except queue.Full:
+            return  # writer is stuck on disk I/O; it is a daemon thread, let it go
+        thread.join(timeout)
+
+    def clear(self) -> None:
+        """Remove the autosave file (e.g. the game really ended). Call after stop()."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    # -------- helpers --------
+    def _offer(self, item: tuple[float, dict]) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                if self._drain():
+                    with self._lock:
+                        self.stats.dropped += 1
+
+    def _drain(self) -> bool:
+        try:
+            self._queue.get_nowait()
+            return True
+        except queue.Empty:
+            return False
+
+    def _run(self) -> None:
+        while True:
+            t0, snap = self._queue.get()
+            if snap is None:
+                return
+            try:
+                self._write(snap)
+            except Exception:  # keep the writer alive, e.g. on unserializable inventory
+                with self._lock:
+                    self.stats.failed += 1
+                continue
+            ms = (time.perf_counter() - t0) * 1000
+            with self._lock:
+                self.stats.saved += 1
+                self.stats.last_ms = ms
+                self.stats.total_ms += ms
+                self.stats.max_ms = max(self.stats.max_ms, ms)
+
+    def _write(self, snap: dict) -> None:
+        folder = os.path.dirname(self.path)
+        fd, tmp = tempfile.mkstemp(prefix=".autosave-", suffix=".tmp", dir=folder)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snap, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try: os.remove(tmp)
+            except OSError: pass
+            raise
+
+
+def load_autosave(path: str) -> GameState:
+    """Restore a GameState written by Autosaver."""
+    with open(path, encoding="utf-8") as f:
+        return GameState.from_snapshot(json.load(f))
+
+
+def resume(path: str) -> Optional[GameState]:
+    """The autosaved game at `path` if there is one still in progress, else None."""
+    try:
+        state = load_autosave(path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if state.is_over:
+        return None
+    state.message = f"Resumed from autosave (turn {state.turn})."
+    return state
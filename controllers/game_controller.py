@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Tuple, Iterable, Optional
+from typing import Tuple, Iterable, Optional, Callable
 from models.game_state import GameState
+from models.turn_delta import TurnDelta
 import random
 
 # Game rules
@@ -10,14 +11,52 @@ DAMAGE_ADJ = 1
 DAMAGE_ON  = 2
 MAX_HP = 1
 
+DeltaListener = Callable[[TurnDelta], None]
+
 
 class GameController:
     DIRS: dict[str, Tuple[int, int]] = {
         "n": (0, -1), "s": (0,  1), "w": (-1, 0), "e": (1, 0)
     }
+    QUIT = ("quit", "exit", "q")
+
+    def __init__(self) -> None:
+        self._listeners: list[DeltaListener] = []
+
+    # -------- turn delta events --------
+    def subscribe(self, listener: DeltaListener) -> None:
+        """Call `listener(delta)` after every turn resolved by step()."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: DeltaListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _publish(self, delta: TurnDelta) -> None:
+        for listener in list(self._listeners):
+            listener(delta)
 
     # Shared rules (console + GUI call this)
-    def step(self, dx: int, dy: int, state: GameState) -> None:
+    def step(self, dx: int, dy: int, state: GameState) -> TurnDelta:
+        state.turn += 1
+        delta = TurnDelta(
+            turn=state.turn,
+            player_from=state.player.pos,
+            player_to=state.player.pos,
+            hp_before=state.player.hp,
+            hp_after=state.player.hp,
+        )
+        self._resolve(dx, dy, state, delta)
+
+        delta.player_to = state.player.pos
+        delta.hp_after = state.player.hp
+        delta.message = state.message
+        delta.is_over = state.is_over
+        delta.did_win = state.did_win
+        self._publish(delta)
+        return delta
+
+    def _resolve(self, dx: int, dy: int, state: GameState, delta: TurnDelta) -> None:
         px, py = state.player.pos
         nx, ny = px + dx, py + dy
 
@@ -43,6 +82,7 @@ class GameController:
         # --- 2) Coin pickup -----------------------------------------------
         if (nx, ny) in state.world.gold:
             state.world.gold.remove((nx, ny))
+            delta.coins_removed.append((nx, ny))
             state.player.gold += 1
             msgs.append("You pick up a coin!")
 
@@ -64,7 +104,7 @@ class GameController:
                 return
 
         # --- 4) Monsters move (random walk) --------------------------------
-        self._tick_monsters(state)
+        delta.monsters_moved = self._tick_monsters(state)
 
         # --- 5) Post-tick random encounter (on/adjacent) -------------------
         # If we already resolved a same-tile collision above, avoid double “on‑tile” hits this turn.
@@ -82,6 +122,17 @@ class GameController:
         if hint:
             state.message += f" | {hint}"
 
+    def quit(self, state: GameState) -> TurnDelta:
+        """End the game at the player's request; published as its own (final) turn."""
+        state.turn += 1
+        state.is_over = True
+        state.message = "You gave up. Game over."
+        pos, hp = state.player.pos, state.player.hp
+        delta = TurnDelta(turn=state.turn, player_from=pos, player_to=pos,
+                          hp_before=hp, hp_after=hp, message=state.message, is_over=True)
+        self._publish(delta)
+        return delta
+
     # Text console handler
     def handle(self, raw: str, state: GameState) -> None:
         cmd = raw.strip().lower()
@@ -89,9 +140,8 @@ class GameController:
         if state.is_over:
             return  # ignore inputs after end
 
-        if cmd in ("quit", "exit", "q"):
-            state.is_over = True
-            state.message = "You gave up. Game over."
+        if cmd in self.QUIT:
+            self.quit(state)
             return
 
         if cmd in ("help", "?"):
@@ -120,9 +170,10 @@ class GameController:
         state.player.hp = max(0, state.player.hp - dmg)
         return state.player.hp <= 0
 
-    def _tick_monsters(self, state: GameState) -> None:
-        """Each monster does a random walk (N/S/E/W if walkable)."""
+    def _tick_monsters(self, state: GameState) -> list[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Each monster does a random walk (N/S/E/W if walkable). Returns the (from, to) moves."""
         new_positions: set[Tuple[int, int]] = set()
+        moves: list[Tuple[Tuple[int, int], Tuple[int, int]]] = []
         taken = set()  # avoid collapsing multiple monsters into one tile this tick
 
         def neighbors(x: int, y: int) -> list[Tuple[int, int]]:
@@ -146,8 +197,11 @@ class GameController:
 
             new_positions.add(dest)
             taken.add(dest)
+            if dest != (mx, my):
+                moves.append(((mx, my), dest))
 
         state.world.monsters = new_positions
+        return moves
 
     def _maybe_encounter(self, state: GameState, *, allow_on_tile: bool = True) -> str | "":
         """Chance to take damage when monsters are on/adjacent after their move."""
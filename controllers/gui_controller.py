@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Tuple
 from models.game_state import GameState
-from controllers.game_controller import GameController
+from controllers.game_controller import GameController, DeltaListener
 
 class GUIController:
     DIRS: dict[str, Tuple[int, int]] = {
@@ -15,6 +15,15 @@ class GUIController:
     def __init__(self) -> None:
         self.core = GameController()  # share rules with console
 
+    def subscribe(self, listener: DeltaListener) -> None:
+        """Receive the TurnDelta of every move resolved by the shared rules."""
+        self.core.subscribe(listener)
+
+    def quit(self, state: GameState) -> None:
+        """Window closed: end the game through the shared rules so subscribers hear it."""
+        if not state.is_over:
+            self.core.quit(state)
+
     def handle(self, raw: str, state: GameState) -> None:
         if state.is_over:
             return  # ignore inputs after game ends
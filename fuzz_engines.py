@@ -0,0 +1,300 @@
+"""
+Differential fuzzer: checks alternative rule engines against GameController.
+
+Random maps and command streams are played through the reference engine and
+every registered alternative with the global `random` module seeded identically,
+the full state is compared after every turn, and failing cases are shrunk to a
+minimal reproduction.
+
+    python fuzz_engines.py --import my_fast_engine --cases 20000 --jobs 8
+    python fuzz_engines.py --import my_fast_engine --repro failing_case.json
+
+An engine is anything with `step(dx, dy, state)`; register a zero-arg factory
+from a module passed with --import (worker processes re-import those modules,
+so engines registered any other way are not seen with --jobs > 1):
+
+    from fuzz_engines import register_engine
+    register_engine("array", ArrayEngine)
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import random
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from typing import Callable, List, Optional, Protocol, Tuple
+
+from controllers.game_controller import GameController
+from models.game_state import GameState
+from models.player import Player
+from models.world import World
+
+Pos = Tuple[int, int]
+
+
+class Engine(Protocol):
+    def step(self, dx: int, dy: int, state: GameState) -> object: ...
+
+
+EngineFactory = Callable[[], Engine]
+
+ENGINES: dict[str, EngineFactory] = {}
+
+# Run as a script, engine modules doing `from fuzz_engines import register_engine`
+# must see this module's registry, not a second copy.
+if __name__ in ("__main__", "__mp_main__"):
+    sys.modules.setdefault("fuzz_engines", sys.modules[__name__])
+
+
+def register_engine(name: str, factory: EngineFactory) -> None:
+    ENGINES[name] = factory
+
+
+DIRS = GameController.DIRS
+START: Pos = (1, 1)
+
+
+@dataclass
+class Case:
+    seed: int                      # seeds `random` before the run
+    rows: List[str]
+    exit: Pos
+    gold: List[Pos] = field(default_factory=list)
+    monsters: List[Pos] = field(default_factory=list)
+    cmds: str = ""                 # one of n/s/e/w per turn
+
+    def new_state(self) -> GameState:
+        world = World(list(self.rows), gold=set(self.gold), monsters=set(self.monsters), exit=self.exit)
+        return GameState(world=world, player=Player(pos=START))
+
+    def to_json(self) -> str:
+        return json.dumps({"seed": self.seed, "rows": self.rows, "exit": self.exit,
+                           "gold": self.gold, "monsters": self.monsters, "cmds": self.cmds})
+
+    @classmethod
+    def from_json(cls, text: str) -> "Case":
+        d = json.loads(text)
+        return cls(seed=d["seed"], rows=list(d["rows"]), exit=tuple(d["exit"]),
+                   gold=[tuple(g) for g in d["gold"]],
+                   monsters=[tuple(m) for m in d["monsters"]], cmds=d["cmds"])
+
+
+@dataclass
+class Mismatch:
+    engine: str
+    turn: int          # index into cmds of the first divergent turn
+    expected: object
+    actual: object
+    case: Case
+
+
+# -------- generation --------
+def gen_case(seed: int, max_turns: int = 200) -> Case:
+    rng = random.Random(seed)
+    w, h = rng.randint(4, 16), rng.randint(4, 10)
+    density = rng.choice((0.0, 0.1, 0.25, 0.4))
+    rows = []
+    for y in range(h):
+        row = ""
+        for x in range(w):
+            border = x in (0, w - 1) or y in (0, h - 1)
+            row += "#" if border or (rng.random() < density and (x, y) != START) else "."
+        rows.append(row)
+
+    world = World(rows)
+    floors = [p for p in world.floor_positions() if p != START]
+    world.exit = rng.choice(floors) if floors else START
+    world.populate(start=START, n_coins=rng.randint(1, 6), n_monsters=rng.randint(0, 6),
+                   seed=rng.getrandbits(32))
+
+    cmds = "".join(rng.choice("nsew") for _ in range(rng.randint(1, max_turns)))
+    return Case(seed=rng.getrandbits(32), rows=rows, exit=world.exit,
+                gold=sorted(world.gold), monsters=sorted(world.monsters), cmds=cmds)
+
+
+# -------- running --------
+def _norm(state: GameState) -> tuple:
+    """Order-independent view of the full state, cheap to compare."""
+    w, p = state.world, state.player
+    return (tuple(w.rows), frozenset(w.gold), frozenset(w.monsters), w.exit,
+            p.pos, p.hp, p.gold, tuple(p.inventory),
+            state.message, state.is_over, state.did_win, state.turn)
+
+
+def run(factory: EngineFactory, case: Case) -> List[tuple]:
+    """Play `case` through one engine and return the normalized state after each turn."""
+    state = case.new_state()
+    engine = factory()
+    random.seed(case.seed)
+    trace: List[tuple] = []
+    for c in case.cmds:
+        if state.is_over:
+            break
+        dx, dy = DIRS[c]
+        try:
+            engine.step(dx, dy, state)
+        except Exception as e:  # a crash is a divergence like any other
+            trace.append(("error", type(e).__name__, str(e)))
+            break
+        trace.append(_norm(state))
+    return trace
+
+
+def compare(name: str, factory: EngineFactory, case: Case,
+            reference: Optional[List[tuple]] = None) -> Optional[Mismatch]:
+    ref = reference if reference is not None else run(GameController, case)
+    got = run(factory, case)
+    for i in range(max(len(ref), len(got))):
+        a = ref[i] if i < len(ref) else None
+        b = got[i] if i < len(got) else None
+        if a != b:
+            return Mismatch(name, i, a, b, case)
+    return None
+
+
+# -------- shrinking --------
+def shrink(name: str, factory: EngineFactory, case: Case) -> Case:
+    """Greedily drop commands, monsters and coins while the engines still disagree."""
+    def fails(c: Case) -> Optional[Mismatch]:
+        return compare(name, factory, c)
+
+    m = fails(case)
+    if m is None:
+        return case
+    case = replace(case, cmds=case.cmds[:m.turn + 1])
+
+    progress = True
+    while progress:
+        progress = False
+
+        # Remove command chunks, halving the chunk size (ddmin-style).
+        chunk = max(1, len(case.cmds) // 2)
+        while chunk >= 1:
+            i = 0
+            while i < len(case.cmds) and len(case.cmds) > 1:
+                cand = replace(case, cmds=case.cmds[:i] + case.cmds[i + chunk:])
+                if cand.cmds and (m := fails(cand)):
+                    case = replace(cand, cmds=cand.cmds[:m.turn + 1])
+                    progress = True
+                else:
+                    i += chunk
+            chunk //= 2
+
+        for attr in ("monsters", "gold"):
+            items = getattr(case, attr)
+            i = 0
+            while i < len(items):
+                cand = replace(case, **{attr: items[:i] + items[i + 1:]})
+                if fails(cand):
+                    case, items, progress = cand, getattr(cand, attr), True
+                else:
+                    i += 1
+
+        # Try a few other seeds: a smaller seed reads better in a bug report.
+        for s in range(8):
+            if s != case.seed and fails(replace(case, seed=s)):
+                if s < case.seed:
+                    case, progress = replace(case, seed=s), True
+                break
+    return case
+
+
+# -------- driver --------
+def check_seed(seed: int, names: List[str], max_turns: int) -> Tuple[int, List[Mismatch]]:
+    case = gen_case(seed, max_turns)
+    ref = run(GameController, case)
+    found = []
+    for name in names:
+        m = compare(name, ENGINES[name], case, reference=ref)
+        if m:
+            found.append(m)
+    return len(ref), found
+
+
+def _init_worker(modules: List[str]) -> None:
+    """Populate ENGINES; runs in the parent and again in every pool worker."""
+    for mod in modules:
+        importlib.import_module(mod)
+    if not ENGINES:
+        # Nothing to compare against: check the reference against itself (determinism smoke test).
+        register_engine("reference", GameController)
+
+
+def _check(args: tuple) -> Tuple[int, List[Mismatch]]:
+    return check_seed(*args)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--import", dest="modules", action="append", default=[],
+                    help="module that calls register_engine() (repeatable)")
+    ap.add_argument("--engine", action="append", default=[], help="engine name (default: all registered)")
+    ap.add_argument("--cases", type=int, default=1000)
+    ap.add_argument("--turns", type=int, default=200, help="max turns per case")
+    ap.add_argument("--seed", type=int, default=0, help="first case seed")
+    ap.add_argument("--jobs", type=int, default=1)
+    ap.add_argument("--max-failures", type=int, default=3, help="stop after this many mismatches")
+    ap.add_argument("--repro", metavar="CASE",
+                    help="replay one case (a printed repro: JSON text or a file containing it)")
+    args = ap.parse_args(argv)
+
+    _init_worker(args.modules)
+    names = args.engine or list(ENGINES)
+    unknown = [n for n in names if n not in ENGINES]
+    if unknown:
+        ap.error(f"unknown engine(s): {', '.join(unknown)}; registered: {', '.join(ENGINES)}")
+
+    if args.repro:
+        text = args.repro
+        if not text.lstrip().startswith("{"):
+            with open(text, encoding="utf-8") as f:
+                text = f.read()
+        case = Case.from_json(text)
+        found = [m for n in names if (m := compare(n, ENGINES[n], case))]
+        for m in found:
+            _report(m, case)
+        if not found:
+            print(f"OK: {len(case.cmds)} command(s) agree across {len(names)} engine(s)")
+        return 1 if found else 0
+
+    work = [(s, names, args.turns) for s in range(args.seed, args.seed + args.cases)]
+    turns, failures = 0, []
+    t0 = time.perf_counter()
+    if args.jobs > 1:
+        with multiprocessing.Pool(args.jobs, _init_worker, (args.modules,)) as pool:
+            for n, found in pool.imap_unordered(_check, work, chunksize=64):
+                turns += n
+                failures += found
+                if len(failures) >= args.max_failures:
+                    pool.terminate()
+                    break
+    else:
+        for item in work:
+            n, found = _check(item)
+            turns += n
+            failures += found
+            if len(failures) >= args.max_failures:
+                break
+    dt = time.perf_counter() - t0
+
+    print(f"{turns} turns over {args.cases} cases x {len(names)} engine(s) "
+          f"in {dt:.1f}s ({turns / dt if dt else 0:.0f} turns/s)")
+    for m in failures[:args.max_failures]:
+        small = shrink(m.engine, ENGINES[m.engine], m.case)
+        _report(compare(m.engine, ENGINES[m.engine], small) or m, small)
+    return 1 if failures else 0
+
+
+def _report(m: Mismatch, case: Case) -> None:
+    print(f"\nMISMATCH [{m.engine}] at turn {m.turn}")
+    print(f"  expected: {m.expected}")
+    print(f"  actual:   {m.actual}")
+    print(f"  repro:    {case.to_json()}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+from controllers.autosave import Autosaver, resume
 from controllers.game_controller import GameController
 from models.game_state import GameState
 from models.player import Player
 from models.world import World
 from views.console_view import ConsoleView
 
+AUTOSAVE_PATH = "autosave.json"
+AUTOSAVE_INTERVAL = 5.0  # seconds between snapshots
+
 
 def main() -> None:
-    # Initialize compact world and player
-    world = World.default_small()
-    player = Player(pos=(1, 1))  # (1,1) is guaranteed to be a floor in both defaults
-    state = GameState(world=world, player=player)
+    state = resume(AUTOSAVE_PATH)  # pick up an interrupted run, if any
+    if state is None:
+        # Initialize compact world and player
+        world = World.default_small()
+        player = Player(pos=(1, 1))  # (1,1) is guaranteed to be a floor in both defaults
+        state = GameState(world=world, player=player)
 
     view = ConsoleView()
     controller = GameController()
+    autosaver = Autosaver(AUTOSAVE_PATH, interval=AUTOSAVE_INTERVAL)
+    autosaver.start()
+    suspended = False
 
     # Main loop
     while not state.is_over:
@@ -23,14 +32,26 @@ def main() -> None:
             cmd = input("> ")
         except (EOFError, KeyboardInterrupt):
             cmd = "quit"
+        if cmd.strip().lower() in GameController.QUIT:
+            # Leaving mid-run: save it as still in progress so it can be resumed.
+            autosaver.save_now(state)
+            suspended = True
         controller.handle(cmd, state)
+        if not state.is_over:
+            autosaver.maybe_save(state)  # snapshot only; the write happens off-thread
 
     # final screen
     view.render(state)
+    autosaver.stop()
+    if not suspended:
+        autosaver.clear()  # won or died: nothing to resume
+    print(autosaver.stats.summary())
     if state.did_win:
         print("\nYou escaped the dungeon—nice work!")
+    elif suspended:
+        print("\nProgress autosaved — run again to resume.")
     print("\nThanks for playing!")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,17 +1,27 @@
 from __future__ import annotations
+from controllers.autosave import Autosaver, resume
 from controllers.gui_controller import GUIController
 from models.game_state import GameState
 from models.player import Player
 from models.world import World
 from views.gui_view import GuiView
 
+AUTOSAVE_PATH = "autosave.json"
+AUTOSAVE_INTERVAL = 5.0  # seconds between snapshots
+
 def main() -> None:
-    world = World.default()
-    player = Player(pos=(1, 1))
-    state = GameState(world=world, player=player)
+    state = resume(AUTOSAVE_PATH)  # pick up an interrupted run, if any
+    if state is None:
+        world = World.default()
+        player = Player(pos=(1, 1))
+        state = GameState(world=world, player=player)
 
     view = GuiView()
     controller = GUIController()
+    autosaver = Autosaver(AUTOSAVE_PATH, interval=AUTOSAVE_INTERVAL)
+    autosaver.start()
+    suspended = False
+    saved_turn = state.turn
 
     def on_key(event) -> None:
         if state.is_over:
@@ -22,16 +32,40 @@ def main() -> None:
         if state.is_over:
             view.show_end_screen(state.did_win, state.message, on_quit=lambda: view.root.destroy())
 
+    def autosave_tick() -> None:
+        # Runs on the Tk loop: snapshot only, the write happens off-thread.
+        nonlocal saved_turn
+        if state.is_over:
+            return
+        if state.turn != saved_turn:
+            autosaver.save_now(state)
+            saved_turn = state.turn
+        view.root.after(int(AUTOSAVE_INTERVAL * 1000), autosave_tick)
+
+    def on_close() -> None:
+        nonlocal suspended
+        if not state.is_over:
+            # Closed mid-run: save it as still in progress so it can be resumed.
+            autosaver.save_now(state)
+            suspended = True
+        controller.quit(state)
+
     def start_game() -> None:
         for keysym in ("Up", "Down", "Left", "Right", "w", "a", "s", "d"):
             view.bind_key(f"<{keysym}>", on_key)
         view.render(state)
         view.root.focus_set()
 
-    view.set_on_close(lambda: setattr(state, "is_over", True))
+    view.set_on_close(on_close)
     view.render(state)
     view.show_start_screen(start_game)
+    view.root.after(int(AUTOSAVE_INTERVAL * 1000), autosave_tick)
     view.mainloop()
 
+    autosaver.stop()
+    if not suspended:
+        autosaver.clear()  # won or died: nothing to resume
+    print(autosaver.stats.summary())
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
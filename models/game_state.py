@@ -16,6 +16,47 @@ class GameState:
     message: str = ""
     is_over: bool = False
     did_win: bool = False
+    turn: int = 0  # turns published by GameController (moves, plus a final quit)
 
     # Reserved for future extensibility (e.g., turn counters)
-    flags: dict[str, object] = field(default_factory=dict)
\ No newline at end of file
+    flags: dict[str, object] = field(default_factory=dict)
+
+    def snapshot(self) -> dict:
+        """
+        Cheap, self-contained copy of the state as plain data (safe to hand
+        to another thread). Row strings are immutable, so only the list is copied.
+        """
+        w, p = self.world, self.player
+        return {
+            "turn": self.turn,
+            "message": self.message,
+            "is_over": self.is_over,
+            "did_win": self.did_win,
+            "world": {
+                "rows": list(w.rows),
+                "gold": list(w.gold),
+                "monsters": list(w.monsters),
+                "exit": w.exit,
+            },
+            "player": {
+                "pos": p.pos,
+                "hp": p.hp,
+                "gold": p.gold,
+                "inventory": list(p.inventory),
+            },
+        }
+
+    @classmethod
+    def from_snapshot(cls, snap: dict) -> "GameState":
+        """Rebuild a GameState from snapshot() output (or its JSON round-trip)."""
+        w, p = snap["world"], snap["player"]
+        world = World(
+            list(w["rows"]),
+            gold={tuple(c) for c in w["gold"]},
+            monsters={tuple(m) for m in w["monsters"]},
+            exit=tuple(w["exit"]),
+        )
+        player = Player(pos=tuple(p["pos"]), hp=p["hp"], gold=p["gold"],
+                        inventory=list(p["inventory"]))
+        return cls(world=world, player=player, message=snap["message"],
+                   is_over=snap["is_over"], did_win=snap["did_win"], turn=snap["turn"])
\ No newline at end of file
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from models.game_state import GameState
+
+Pos = Tuple[int, int]
+
+
+@dataclass
+class TurnDelta:
+    """
+    What changed during a single turn, as produced by GameController.step.
+
+    Consumers (views, recorders, network clients) can apply a delta to their
+    own copy of the state instead of rescanning the whole world.
+    """
+    turn: int
+    player_from: Pos
+    player_to: Pos
+    hp_before: int
+    hp_after: int
+    coins_removed: List[Pos] = field(default_factory=list)
+    monsters_moved: List[Tuple[Pos, Pos]] = field(default_factory=list)  # (from, to)
+    message: str = ""
+    is_over: bool = False
+    did_win: bool = False
+
+    @property
+    def player_moved(self) -> bool:
+        return self.player_from != self.player_to
+
+    @property
+    def hp_changed(self) -> bool:
+        return self.hp_before != self.hp_after
+
+    def apply(self, state: GameState) -> None:
+        """Bring a mirrored state (taken before this turn) up to date."""
+        state.turn = self.turn
+        state.player.pos = self.player_to
+        state.player.hp = self.hp_after
+        for c in self.coins_removed:
+            state.world.gold.discard(c)
+        state.player.gold += len(self.coins_removed)
+
+        # Monsters move simultaneously: clear all sources before placing anyone.
+        if self.monsters_moved:
+            srcs = {src for src, _ in self.monsters_moved}
+            dests = {dst for _, dst in self.monsters_moved}
+            state.world.monsters = (state.world.monsters - srcs) | dests
+
+        state.message = self.message
+        state.is_over = self.is_over
+        state.did_win = self.did_win
+
+    # ---------- compact wire format ----------
+    def to_compact(self) -> dict:
+        """Short-keyed, JSON-friendly dict; unchanged fields are omitted."""
+        d: dict = {"t": self.turn}
+        if self.player_moved:
+            d["p"] = [*self.player_from, *self.player_to]
+        if self.hp_changed:
+            d["h"] = self.hp_after
+        if self.coins_removed:
+            d["c"] = [list(c) for c in self.coins_removed]
+        if self.monsters_moved:
+            d["m"] = [[*src, *dst] for src, dst in self.monsters_moved]
+        if self.message:
+            d["msg"] = self.message
+        if self.is_over:
+            d["o"] = 2 if self.did_win else 1
+        return d
+
+    @classmethod
+    def from_compact(cls, d: dict, prev: GameState) -> "TurnDelta":
+        """
+        Rebuild a delta from to_compact(). Fields omitted on the wire were
+        unchanged, so `prev` (the receiver's state before this turn) fills them in.
+        """
+        pos, hp = prev.player.pos, prev.player.hp
+        if "p" in d:
+            fx, fy, tx, ty = d["p"]
+            p_from, p_to = (fx, fy), (tx, ty)
+        else:
+            p_from = p_to = pos
+        over = d.get("o", 0)
+        return cls(
+            turn=d["t"],
+            player_from=p_from,
+            player_to=p_to,
+            hp_before=hp,
+            hp_after=d.get("h", hp),
+            coins_removed=[(x, y) for x, y in d.get("c", [])],
+            monsters_moved=[((a, b), (c, e)) for a, b, c, e in d.get("m", [])],
+            message=d.get("msg", ""),
+            is_over=over > 0,
+            did_win=over == 2,
+        )